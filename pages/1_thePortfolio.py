@@ -2,7 +2,7 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from src.greeks import GreekCalculator
+from src.greeks import portfolio_greeks
 import plotly.graph_objects as go
 
 st.set_page_config(layout="wide")
@@ -26,8 +26,32 @@ demo_portfolio = [
     }
 ]
 
+
+@st.cache_data(max_entries=64)
+def portfolio_exposure(portfolio_spec, S_min, S_max, r):
+    S_range = np.linspace(S_min, S_max, 200)
+
+    # Column (SoA) layout of the portfolio, one entry per option
+    n = len(portfolio_spec)
+    is_call = np.fromiter((o[0] == "call" for o in portfolio_spec), dtype=bool, count=n)
+    K, q, sigma, prem, T = (np.fromiter((o[j] for o in portfolio_spec), dtype=np.float64, count=n)
+                            for j in range(1, 6))
+
+    totals = portfolio_greeks(S_range, K, q, T, sigma, is_call, r, premium=prem)
+    return S_range, totals
+
+
+def refresh_portfolio_views():
+    # Derived views are rebuilt only when the portfolio itself changes, not on every rerun
+    st.session_state.df_portfolio = pd.DataFrame(st.session_state.portfolio)
+    st.session_state.strikes_np = np.fromiter((o["strike"] for o in st.session_state.portfolio),
+                                              dtype=np.float64, count=len(st.session_state.portfolio))
+
+
 if "portfolio" not in st.session_state:
     st.session_state.portfolio = demo_portfolio
+if "df_portfolio" not in st.session_state:
+    refresh_portfolio_views()
 
 st.title("Portfolio Sensitivity Dashboard")
 st.write("Evaluate the impact of market movements on portfolio performance by monitoring aggregated "
@@ -67,49 +91,39 @@ with left:
                 "implied_volatility": iv,
                 "premium": premium
             })
+            refresh_portfolio_views()
     with button2:
         if st.button("Clear Portfolio"):
             st.session_state.portfolio = []
+            refresh_portfolio_views()
 
 
 if st.session_state.portfolio:
-    df_portfolio = pd.DataFrame(st.session_state.portfolio)
-
     # Display portfolio table
     with right:
         st.subheader("Current Portfolio")
-        st.dataframe(df_portfolio)
+        st.dataframe(st.session_state.df_portfolio)
 
-    strikes = df_portfolio["strike"].astype(float)
+    strikes = st.session_state.strikes_np
     S_min = max(1, strikes.min() * 0.6)
     S_max = strikes.max() * 1.4
-    S_range = np.linspace(S_min, S_max, 200)
     r = 0.05
-    total_delta = np.zeros_like(S_range)
-    total_gamma = np.zeros_like(S_range)
-    total_vega = np.zeros_like(S_range)
-    total_theta = np.zeros_like(S_range)
-    total_rho = np.zeros_like(S_range)
-    total_payoff = np.zeros_like(S_range)
-
-    for option in st.session_state.portfolio:
-        o_type = option["option_type"]
-        K = float(option["strike"])
-        q = int(option["qty"])
-        sigma = float(option["implied_volatility"])
-        prem = float(option["premium"])
-        expiry_date = datetime.combine(option["expiry"], datetime.min.time())
-        T = max((expiry_date - datetime.now()).days / 365, 1e-6)
-
-        for i, S in enumerate(S_range):
-            greek = GreekCalculator(S, K, T, r, sigma, o_type)
-            intrinsic_value = max(S - K, 0) if o_type == "call" else max(K - S, 0)
-            total_payoff[i] += q * (intrinsic_value - prem)
-            total_delta[i] += q * greek.delta()
-            total_gamma[i] += q * greek.gamma()
-            total_vega[i] += q * greek.vega()
-            total_theta[i] += q * greek.theta()
-            total_rho[i] += q * greek.rho()
+
+    # Order-independent key: only adding/removing an option (or a new day) invalidates it
+    now = datetime.now()
+    midnight = datetime.min.time()
+    portfolio_spec = tuple(sorted(
+        (option["option_type"], float(option["strike"]), int(option["qty"]),
+         float(option["implied_volatility"]), float(option["premium"]),
+         max((datetime.combine(option["expiry"], midnight) - now).days / 365, 1e-6))
+        for option in st.session_state.portfolio
+    ))
+    exposure_key = (portfolio_spec, S_min, S_max, r)
+    if st.session_state.get("exposure_key") != exposure_key:
+        st.session_state.exposure = portfolio_exposure(portfolio_spec, S_min, S_max, r)
+        st.session_state.exposure_key = exposure_key
+    S_range, totals = st.session_state.exposure
+    total_payoff, total_delta, total_gamma, total_vega, total_theta, total_rho = totals
 
     # ===== Dashboard =====
 
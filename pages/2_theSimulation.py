@@ -1,7 +1,8 @@
+import math
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy.stats import norm
+from src.simulation import bs_delta, hedge_pnl
 
 st.set_page_config(page_title="Delta Hedging Simulator", layout="centered")
 
@@ -41,55 +42,43 @@ with col9:
 
 N = st.slider("Number of Time Steps", min_value=10, max_value=500, value=252)
 M = st.slider("Number of Simulations", min_value=100, max_value=1000, value=300)
+seed = st.number_input("Random Seed", value=42, step=1)
 
 
-# --- Black-Scholes Delta ---
-def bs_delta(S, K, T, r, sigma, option_type):
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    return norm.cdf(d1) if option_type == "call" else -norm.cdf(-d1)
-
-# --- Run Simulation ---
-if st.button("Run Simulation"):
+# --- Simulation ---
+@st.cache_data(show_spinner=False)
+def run_sim(S0, mu, sigma, T, N, M, r, strike, option_type, premium, qty, seed):
     dt = T / N
     t_vals = np.linspace(0, T, N + 1)
 
-    dW = np.random.normal(0, np.sqrt(dt), size=(M, N))
-    W = np.cumsum(dW, axis=1)
-    W = np.concatenate([np.zeros((M, 1)), W], axis=1)
-    S_paths = S0 * np.exp((mu - 0.5 * sigma**2) * t_vals + sigma * W)
-
-    pnl_paths = []
-    stock_paths = []
-    delta_paths = []
-
-    for path in S_paths:
-        cash_account = 0
-        delta_prev = 0
-        deltas = []
-        stock_track = []
-
-        for i in range(N):
-            S_t = path[i]
-            tau = T - i * dt
-            if tau <= 0:
-                break
-            delta = bs_delta(S_t, strike, tau, r, sigma, option_type)
-            d_delta = delta - delta_prev
-            cash_account -= d_delta * S_t
-            cash_account *= np.exp(r * dt)
-            delta_prev = delta
-
-            deltas.append(delta)
-            stock_track.append(S_t)
-
-        S_T = path[-1]
-        payoff = max(S_T - strike, 0) if option_type == "call" else max(strike - S_T, 0)
-        hedge_value = delta_prev * S_T + cash_account
-        pnl = (hedge_value - payoff) * qty - premium * qty
-
-        pnl_paths.append(pnl)
-        stock_paths.append(stock_track)
-        delta_paths.append(deltas)
+    # Brownian paths with a leading zero column, written in place
+    rng = np.random.default_rng(seed)
+    dW = rng.standard_normal((M, N))
+    dW *= math.sqrt(dt)
+    W = np.empty((M, N + 1))
+    W[:, 0] = 0.0
+    np.cumsum(dW, axis=1, out=W[:, 1:])
+
+    S_paths = np.empty_like(W)
+    np.multiply(W, sigma, out=S_paths)
+    S_paths += (mu - 0.5 * sigma**2) * t_vals
+    np.exp(S_paths, out=S_paths)
+    S_paths *= S0
+
+    # Hedge ratio at every rebalancing date, for all paths at once
+    tau_vec = T - np.arange(N) * dt
+    delta_paths = bs_delta(S_paths[:, :N], strike, tau_vec, r, sigma, option_type)
+    pnl_paths = hedge_pnl(S_paths, delta_paths, strike, r, dt, option_type, premium, qty)
+
+    # Only the first paths are ever plotted
+    return t_vals, S_paths[:20], delta_paths[:20], pnl_paths
+
+
+# --- Run Simulation ---
+if st.button("Run Simulation"):
+    t_vals, stock_paths, delta_paths, pnl_paths = run_sim(
+        S0, mu, sigma, T, N, M, r, strike, option_type, premium, qty, int(seed)
+    )
 
     # Save to session state
     st.session_state['t_vals'] = t_vals
@@ -111,23 +100,29 @@ if st.session_state.get('sim_ran', False):
 
         fig_price = go.Figure()
         if view_option == "Single Path":
+            stride = max(1, len(t_vals) // 200)
             S_path = stock_paths[0]
             fig_price.add_trace(go.Scatter(
-                x=t_vals[:len(S_path)],
-                y=S_path,
+                x=t_vals[:len(S_path):stride],
+                y=S_path[::stride],
                 mode='lines',
                 line=dict(color="orange", width=2.5)
             ))
             fig_price.update_layout(title="Simulated Stock Price Over Time (1 Path)")
         else:
-            for i, path in enumerate(stock_paths[:20]):
-                fig_price.add_trace(go.Scatter(
-                    x=t_vals[:len(path)],
-                    y=path,
-                    mode='lines',
-                    line=dict(width=1, color="orange"),
-                    showlegend=False
-                ))
+            # Thin every path and join them with NaN breaks into a single WebGL trace
+            stride = max(1, len(t_vals) // 100)
+            thinned = stock_paths[:20, ::stride]
+            breaks = np.full((len(thinned), 1), np.nan)
+            xs = np.tile(np.append(t_vals[:stock_paths.shape[1]:stride], np.nan), len(thinned))
+            ys = np.hstack([thinned, breaks]).ravel()
+            fig_price.add_trace(go.Scattergl(
+                x=xs,
+                y=ys,
+                mode='lines',
+                line=dict(width=1, color="orange"),
+                showlegend=False
+            ))
             fig_price.update_layout(title="Simulated Stock Price Paths Over Time (Multiple Paths)")
 
         fig_price.update_layout(
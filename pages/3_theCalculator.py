@@ -1,6 +1,5 @@
 import streamlit as st
-from src.pricing import black_scholes
-from src.greeks import GreekCalculator
+from src.pricing import compute_call_put, validate_inputs
 
 st.set_page_config(page_title="Black Scholes Calculator", layout="centered")
 st.title("Black-Scholes Calculator")
@@ -36,10 +35,8 @@ else:  # Days
     T = time_value / 365
 
 # -- Calculation --
-call_price = black_scholes(S, K, T, r, sigma, option_type='call', q=div)
-put_price  = black_scholes(S, K, T, r, sigma, option_type='put',  q=div)
-call_greeks = GreekCalculator(S, K, T, r, sigma, option_type='call')
-put_greeks  = GreekCalculator(S, K, T, r, sigma, option_type='put')
+validate_inputs(S=S, K=K, T=T, r=r, sigma=sigma, q=div)
+call, put = compute_call_put(S, K, T, r, sigma, q=div)
 
 st.markdown("---")
 # -- Output Section --
@@ -48,23 +45,23 @@ col1, col2 = st.columns(2)
 with col1:
     st.markdown(f"""
     <div style="line-height: 1.6">
-        <h4>📈 Call Option Value: ${call_price:.4f}</h4>
-        <p>Delta: {call_greeks.delta():.4f}</p>
-        <p>Gamma: {call_greeks.gamma():.4f}</p>
-        <p>Theta: {call_greeks.theta():.4f}</p>
-        <p>Vega: {call_greeks.vega():.4f}</p>
-        <p>Rho: {call_greeks.rho():.4f}</p>
+        <h4>📈 Call Option Value: ${call.price:.4f}</h4>
+        <p>Delta: {call.delta:.4f}</p>
+        <p>Gamma: {call.gamma:.4f}</p>
+        <p>Theta: {call.theta:.4f}</p>
+        <p>Vega: {call.vega:.4f}</p>
+        <p>Rho: {call.rho:.4f}</p>
     </div>
     """, unsafe_allow_html=True)
 
 with col2:
     st.markdown(f"""
     <div style="line-height: 1.6">
-        <h4>📉 Put Option Value: ${put_price:.4f}</h4>
-        <p>Delta: {put_greeks.delta():.4f}</p>
-        <p>Gamma: {put_greeks.gamma():.4f}</p>
-        <p>Theta: {put_greeks.theta():.4f}</p>
-        <p>Vega: {put_greeks.vega():.4f}</p>
-        <p>Rho: {put_greeks.rho():.4f}</p>
+        <h4>📉 Put Option Value: ${put.price:.4f}</h4>
+        <p>Delta: {put.delta:.4f}</p>
+        <p>Gamma: {put.gamma:.4f}</p>
+        <p>Theta: {put.theta:.4f}</p>
+        <p>Vega: {put.vega:.4f}</p>
+        <p>Rho: {put.rho:.4f}</p>
     </div>
     """, unsafe_allow_html=True)
@@ -1,12 +1,133 @@
+import math
 import numpy as np
-from scipy.stats import norm
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is optional: fall back to running the kernels as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+_SQRT2 = math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def lazy_ndtr():
+    """Return scipy.special.ndtr, importing scipy only once an ndarray code path needs it."""
+    from scipy.special import ndtr
+    return ndtr
+
+
+# scalar standard normal cdf/pdf, much cheaper than scipy for single values
+@njit(cache=True, fastmath=True)
+def ncdf(x):
+    return 0.5 * (1.0 + math.erf(x / _SQRT2))
+
+
+@njit(cache=True, fastmath=True)
+def npdf(x):
+    return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
+@njit(cache=True, fastmath=True)
+def bs_greeks_scalar(S, K, T, r, sigma, is_call, q=0.0):
+    """Black-Scholes price and Greeks of a single option in one pass.
+
+    q is a continuous dividend yield. Returns (price, delta, gamma, vega, theta, rho).
+    """
+    sign = 1.0 if is_call else -1.0
+    intrinsic = max(sign * (S - K), 0.0)
+
+    if T <= 0 or sigma <= 0:
+        # Expired or zero-vol option: no time value left to be sensitive to
+        disc = math.exp(-r * max(T, 0.0))
+        delta = sign if intrinsic > 0 else 0.0
+        return disc * intrinsic, delta, 0.0, 0.0, 0.0, 0.0
+
+    sqrtT = math.sqrt(T)
+    disc = math.exp(-r * T)
+    div_disc = math.exp(-q * T)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
+    d2 = d1 - sigma * sqrtT
+    pdf_d1 = npdf(d1)
+    cdf_sd1 = ncdf(sign * d1)
+    cdf_sd2 = ncdf(sign * d2)
+
+    price = sign * (S * div_disc * cdf_sd1 - K * disc * cdf_sd2)
+    delta = sign * div_disc * cdf_sd1
+    gamma = div_disc * pdf_d1 / (S * sigma * sqrtT)
+    vega = S * div_disc * pdf_d1 * sqrtT
+    theta = (-(S * div_disc * pdf_d1 * sigma) / (2.0 * sqrtT)
+             - sign * r * K * disc * cdf_sd2 + sign * q * S * div_disc * cdf_sd1)
+    rho = sign * K * T * disc * cdf_sd2
+    return price, delta, gamma, vega, theta, rho
+
+
+@njit(cache=True, fastmath=True)
+def bs_greeks_call_put(S, K, T, r, sigma, q=0.0):
+    """Call and put price and Greeks sharing one set of d1, d2, N(d1), N(d2) and n(d1).
+
+    Returns ((call price, delta, gamma, vega, theta, rho), (put ...)).
+    """
+    if T <= 0 or sigma <= 0:
+        return bs_greeks_scalar(S, K, T, r, sigma, True, q), bs_greeks_scalar(S, K, T, r, sigma, False, q)
+
+    sqrtT = math.sqrt(T)
+    disc = math.exp(-r * T)
+    div_disc = math.exp(-q * T)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
+    d2 = d1 - sigma * sqrtT
+    pdf_d1 = npdf(d1)
+    cdf_d1 = ncdf(d1)
+    cdf_d2 = ncdf(d2)
+    # N(-x) = 1 - N(x), except in the far upper tail where the subtraction cancels to zero
+    cdf_md1 = 1.0 - cdf_d1 if d1 < 8.0 else ncdf(-d1)
+    cdf_md2 = 1.0 - cdf_d2 if d2 < 8.0 else ncdf(-d2)
+
+    gamma = div_disc * pdf_d1 / (S * sigma * sqrtT)
+    vega = S * div_disc * pdf_d1 * sqrtT
+    theta_common = -(S * div_disc * pdf_d1 * sigma) / (2.0 * sqrtT)
+
+    call = (S * div_disc * cdf_d1 - K * disc * cdf_d2,
+            div_disc * cdf_d1,
+            gamma,
+            vega,
+            theta_common - r * K * disc * cdf_d2 + q * S * div_disc * cdf_d1,
+            K * T * disc * cdf_d2)
+    put = (K * disc * cdf_md2 - S * div_disc * cdf_md1,
+           -div_disc * cdf_md1,
+           gamma,
+           vega,
+           theta_common + r * K * disc * cdf_md2 - q * S * div_disc * cdf_md1,
+           -K * T * disc * cdf_md2)
+    return call, put
+
+
+# Serial on purpose: Streamlit calls this from one thread per session, which aborts under numba's
+# workqueue threading layer (its fallback without TBB or OpenMP), and an expiry is only ~100 rows
+@njit(cache=True, fastmath=True)
+def bs_chain_kernel(S, K, T, r, sigma, is_call, out_price):
+    """Fill out_price with the price of every (K, sigma, is_call) row of one expiry."""
+    sqrtT = math.sqrt(max(T, 0.0))
+    disc = math.exp(-r * max(T, 0.0))
+    for i in range(K.shape[0]):
+        sign = 1.0 if is_call[i] else -1.0
+        if T <= 0 or sigma[i] <= 0:
+            # No time value left, as in bs_greeks_scalar
+            out_price[i] = disc * max(sign * (S - K[i]), 0.0)
+        else:
+            d1 = (math.log(S / K[i]) + (r + 0.5 * sigma[i] * sigma[i]) * T) / (sigma[i] * sqrtT)
+            d2 = d1 - sigma[i] * sqrtT
+            out_price[i] = sign * (S * ncdf(sign * d1) - K[i] * disc * ncdf(sign * d2))
 
 
 class GreekCalculator:
     def __init__(self, S, K, T, r, sigma, option_type):
-        for name, val in zip(['S', 'K', 'T', 'r', 'sigma'], [S, K, T, r, sigma]):
-            if not isinstance(val, (int, float)):
-                raise TypeError(f"{name} must be a int or float, got {type(val).__name__}")
         if option_type not in ['call', 'put']:
             raise ValueError("option_type must be 'call' or 'put'")
 
@@ -16,34 +137,24 @@ class GreekCalculator:
         self.r = r
         self.sigma = sigma
         self.option_type = option_type
-        self.d1, self.d2 = self._compute_d1_d2()
-
-    def _compute_d1_d2(self):
-        d1 = (np.log(self.S / self.K) + (self.r + 0.5 * self.sigma**2) * self.T) / (self.sigma * np.sqrt(self.T))
-        d2 = d1 - self.sigma * np.sqrt(self.T)
-        return d1, d2
+        # one kernel call for all five Greeks; the methods below only read the results
+        _, self._delta, self._gamma, self._vega, self._theta, self._rho = bs_greeks_scalar(
+            float(S), float(K), float(T), float(r), float(sigma), option_type == 'call')
 
     def delta(self):
-        return norm.cdf(self.d1) if self.option_type == 'call' else norm.cdf(self.d1) - 1
+        return self._delta
 
     def gamma(self):
-        return norm.pdf(self.d1) / (self.S * self.sigma * np.sqrt(self.T))
+        return self._gamma
 
     def vega(self):
-        return self.S * norm.pdf(self.d1) * np.sqrt(self.T)
+        return self._vega
 
     def theta(self):
-        first_term = - (self.S * norm.pdf(self.d1) * self.sigma) / (2 * np.sqrt(self.T))
-        if self.option_type == 'call':
-            return first_term - self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(self.d2)
-        else:
-            return first_term + self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-self.d2)
+        return self._theta
 
     def rho(self):
-        if self.option_type == 'call':
-            return self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(self.d2)
-        else:
-            return -self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(-self.d2)
+        return self._rho
 
     def to_dict(self):
         return {
@@ -52,4 +163,48 @@ class GreekCalculator:
             'Vega (ν)': self.vega(),
             'Theta (θ)': self.theta(),
             'Rho (ρ)': self.rho()
-        }
\ No newline at end of file
+        }
+
+
+def portfolio_greeks(S_range, K, q, T, sigma, is_call, r, premium=0.0):
+    """Aggregate net PnL at expiry and Greeks of a whole portfolio over S_range.
+
+    K, q, T, sigma, is_call and premium are per-option arrays; every distinct
+    contract is evaluated against every grid point in one 2D broadcast.
+    Returns a (6, len(S_range)) array with rows payoff, delta, gamma, vega, theta, rho.
+    """
+    ndtr = lazy_ndtr()
+    S = np.asarray(S_range, dtype=float)[None, :]
+    K, q, T, sigma = (np.asarray(a, dtype=float) for a in (K, q, T, sigma))
+    sign = np.where(np.asarray(is_call, dtype=bool), 1.0, -1.0)
+    premium_paid = (q * premium).sum()
+
+    # Identical contracts collapse into one row with their quantities summed
+    contracts, inverse = np.unique(np.column_stack([K, T, sigma, sign]), axis=0, return_inverse=True)
+    q = np.bincount(inverse.ravel(), weights=q, minlength=len(contracts))
+    K, T, sigma, sign = (contracts[:, [j]] for j in range(4))
+
+    # sqrt(T) and exp(-rT) are shared by every option on the same expiry
+    expiries, t_idx = np.unique(T, return_inverse=True)
+    sqrtT = np.sqrt(expiries)[t_idx.ravel()][:, None]
+    disc = np.exp(-r * expiries)[t_idx.ravel()][:, None]
+
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrtT)
+    d2 = d1 - sigma * sqrtT
+    pdf_d1 = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+    cdf_sd1 = ndtr(sign * d1)
+    cdf_sd2 = ndtr(sign * d2)
+
+    # One (6, n_contracts, len(S_range)) block, reduced over contracts in a single weighted sum
+    per_contract = np.empty((6,) + d1.shape, dtype=np.float64)
+    per_contract[0] = np.maximum(sign * (S - K), 0)
+    per_contract[1] = sign * cdf_sd1
+    per_contract[2] = pdf_d1 / (S * sigma * sqrtT)
+    per_contract[3] = S * pdf_d1 * sqrtT
+    per_contract[4] = -(S * pdf_d1 * sigma) / (2 * sqrtT) - sign * r * K * disc * cdf_sd2
+    per_contract[5] = sign * K * T * disc * cdf_sd2
+
+    totals = np.empty((6, S.shape[1]), dtype=np.float64)
+    np.matmul(q, per_contract, out=totals)
+    totals[0] -= premium_paid
+    return totals
@@ -1,5 +1,6 @@
+from collections import namedtuple
 import numpy as np
-from scipy.stats import norm
+from src.greeks import bs_greeks_scalar, bs_greeks_call_put, lazy_ndtr, ncdf
 
 """
 Parameters:
@@ -13,10 +14,16 @@ Parameters:
 """
 
 
-def black_scholes(S, K, T, r, sigma, option_type, q=0):
-    for name, val in zip(['S', 'K', 'T', 'r', 'sigma', 'q'], [S, K, T, r, sigma, q]):
+def validate_inputs(option_type=None, **params):
+    """Type checks for user-facing entry points; the pricing kernels themselves stay unchecked."""
+    for name, val in params.items():
         if not isinstance(val, (int, float)):
             raise TypeError(f"{name} must be an int or float, got {type(val).__name__}")
+    if option_type is not None and option_type not in ['call', 'put']:
+        raise ValueError("option_type must be 'call' or 'put'")
+
+
+def black_scholes(S, K, T, r, sigma, option_type, q=0):
     if option_type not in ['call', 'put']:
         raise ValueError("option_type must be 'call' or 'put'")
 
@@ -39,9 +46,54 @@ def black_scholes(S, K, T, r, sigma, option_type, q=0):
     d2 = d1 - sigma * np.sqrt(T)
 
     if option_type == 'call':
-        price = S * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+        price = S * np.exp(-q * T) * ncdf(d1) - K * np.exp(-r * T) * ncdf(d2)
     else:
-        price = K * np.exp(-r * T) * norm.cdf(-d2) - S * np.exp(-q * T) * norm.cdf(-d1)
+        price = K * np.exp(-r * T) * ncdf(-d2) - S * np.exp(-q * T) * ncdf(-d1)
 
     return price
 
+
+def black_scholes_vec(S, K, T, r, sigma, is_call, sqrtT=None, disc=None):
+    """Array version of black_scholes (no dividend): K, sigma and is_call may be arrays.
+
+    sqrtT and disc = exp(-r*T) can be passed in when the caller prices many rows per expiry.
+    """
+    ndtr = lazy_ndtr()
+
+    K = np.asarray(K, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    is_call = np.asarray(is_call, dtype=bool)
+    intrinsic = np.where(is_call, np.maximum(S - K, 0), np.maximum(K - S, 0))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if sqrtT is None:
+            sqrtT = np.sqrt(T)
+        if disc is None:
+            disc = np.exp(-r * T)
+        d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
+        d2 = d1 - sigma * sqrtT
+        cdf_d1 = ndtr(d1)
+        cdf_d2 = ndtr(d2)
+        call = S * cdf_d1 - K * disc * cdf_d2
+        # Put-call parity saves a second pair of cdf evaluations
+        put = call - S + K * disc
+
+    price = np.where(is_call, call, put)
+    # Same edge cases as the scalar pricer: zero volatility, then expired options
+    price = np.where(sigma <= 0, disc * intrinsic, price)
+    price = np.where(T <= 0, intrinsic, price)
+    return price
+
+
+Greeks = namedtuple('Greeks', ['price', 'delta', 'gamma', 'vega', 'theta', 'rho'])
+
+
+def compute_all(S, K, T, r, sigma, is_call, q=0):
+    """Price and all Greeks in one pass, sharing d1, d2, N(d1), N(d2), n(d1) and exp(-rT)."""
+    return Greeks(*bs_greeks_scalar(float(S), float(K), float(T), float(r), float(sigma), bool(is_call), float(q)))
+
+
+def compute_call_put(S, K, T, r, sigma, q=0):
+    """Call and put Greeks at once; the put reuses the call's N(d1), N(d2) through N(-x) = 1 - N(x)."""
+    call, put = bs_greeks_call_put(float(S), float(K), float(T), float(r), float(sigma), float(q))
+    return Greeks(*call), Greeks(*put)
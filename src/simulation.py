@@ -0,0 +1,30 @@
+import numpy as np
+from src.greeks import lazy_ndtr
+
+
+def bs_delta(S, K, T, r, sigma, option_type):
+    """Black-Scholes delta; S may be an (M, N) path matrix and T the matching (N,) times to expiry."""
+    ndtr = lazy_ndtr()
+    # T is per time step, so these terms are computed once per column rather than per path
+    drift = (r + 0.5 * sigma**2) * T
+    inv_vol = 1.0 / (sigma * np.sqrt(T))
+    d1 = (np.log(S / K) + drift) * inv_vol
+    return ndtr(d1) if option_type == "call" else -ndtr(-d1)
+
+
+def hedge_pnl(S_paths, delta_paths, K, r, dt, option_type, premium, qty):
+    """Final PnL of delta hedging each path, with the cash account in closed form.
+
+    Each rebalance at step i is financed from cash and accrues interest for N - i steps,
+    matching a per-step loop that compounds the cash after every rebalance, the last included.
+    """
+    N = delta_paths.shape[1]
+    d_delta = np.diff(delta_paths, axis=1, prepend=0.0)
+    growth = np.exp(r * dt * np.arange(N, 0, -1))
+    cash_account = -np.sum(d_delta * S_paths[:, :N] * growth, axis=1)
+
+    S_T = S_paths[:, -1]
+    sign = 1 if option_type == "call" else -1
+    payoff = np.maximum(sign * (S_T - K), 0)
+    hedge_value = delta_paths[:, -1] * S_T + cash_account
+    return (hedge_value - payoff) * qty - premium * qty
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from src.greeks import bs_chain_kernel, bs_greeks_call_put, bs_greeks_scalar, portfolio_greeks
+
+
+def reference(S, K, T, r, sigma, is_call, q=0.0):
+    # Textbook Black-Scholes-Merton with scipy's normal distribution
+    sign = 1.0 if is_call else -1.0
+    if T <= 0 or sigma <= 0:
+        intrinsic = max(sign * (S - K), 0.0)
+        delta = sign if intrinsic > 0 else 0.0
+        return np.exp(-r * max(T, 0.0)) * intrinsic, delta, 0.0, 0.0, 0.0, 0.0
+
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+    disc, div_disc = np.exp(-r * T), np.exp(-q * T)
+    price = sign * (S * div_disc * norm.cdf(sign * d1) - K * disc * norm.cdf(sign * d2))
+    delta = sign * div_disc * norm.cdf(sign * d1)
+    gamma = div_disc * norm.pdf(d1) / (S * sigma * np.sqrt(T))
+    vega = S * div_disc * norm.pdf(d1) * np.sqrt(T)
+    theta = (-(S * div_disc * norm.pdf(d1) * sigma) / (2 * np.sqrt(T))
+             - sign * r * K * disc * norm.cdf(sign * d2) + sign * q * S * div_disc * norm.cdf(sign * d1))
+    rho = sign * K * T * disc * norm.cdf(sign * d2)
+    return price, delta, gamma, vega, theta, rho
+
+
+CASES = [
+    (100.0, 100.0, 0.5, 0.05, 0.2, 0.0),
+    (100.0, 80.0, 1.0, 0.03, 0.35, 0.02),
+    (100.0, 130.0, 0.1, 0.05, 0.6, 0.0),
+    (100.0, 90.0, 0.0, 0.05, 0.2, 0.0),
+    (100.0, 110.0, -0.01, 0.05, 0.2, 0.0),
+    (100.0, 90.0, 0.5, 0.05, 0.0, 0.0),
+    (100.0, 110.0, 0.5, 0.05, 0.0, 0.0),
+]
+
+
+@pytest.mark.parametrize("S, K, T, r, sigma, q", CASES)
+@pytest.mark.parametrize("is_call", [True, False])
+def test_bs_greeks_scalar(S, K, T, r, sigma, q, is_call):
+    np.testing.assert_allclose(bs_greeks_scalar(S, K, T, r, sigma, is_call, q),
+                               reference(S, K, T, r, sigma, is_call, q), rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("S, K, T, r, sigma, q", CASES)
+def test_bs_greeks_call_put(S, K, T, r, sigma, q):
+    call, put = bs_greeks_call_put(S, K, T, r, sigma, q)
+    np.testing.assert_allclose(call, reference(S, K, T, r, sigma, True, q), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(put, reference(S, K, T, r, sigma, False, q), rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("T", [0.5, 0.0, -0.01])
+def test_bs_chain_kernel(T):
+    S, r = 100.0, 0.05
+    K = np.array([80.0, 95.0, 100.0, 105.0, 120.0, 90.0, 110.0] * 2)
+    sigma = np.array([0.2, 0.3, 0.25, 0.4, 0.5, 0.0, 0.0] * 2)
+    is_call = np.repeat([True, False], 7)
+
+    price = np.empty(len(K))
+    bs_chain_kernel(S, K, T, r, sigma, is_call, price)
+    expected = [reference(S, k, T, r, s, c)[0] for k, s, c in zip(K, sigma, is_call)]
+    np.testing.assert_allclose(price, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_portfolio_greeks_matches_loop():
+    # Repeated contracts (rows 0 and 3), a short leg and two shared expiries
+    K = np.array([100.0, 110.0, 90.0, 100.0, 120.0, 95.0])
+    q = np.array([2.0, -1.0, 3.0, 1.0, 1.0, -2.0])
+    T = np.array([0.5, 0.25, 0.5, 0.5, 1.0, 0.25])
+    sigma = np.array([0.2, 0.3, 0.25, 0.2, 0.35, 0.3])
+    is_call = np.array([True, False, True, True, False, False])
+    premium = np.array([5.0, 4.0, 12.0, 5.0, 20.0, 3.0])
+    r = 0.05
+    S_range = np.linspace(50, 150, 41)
+
+    # The original per-option, per-grid-point accumulation
+    expected = np.zeros((6, len(S_range)))
+    for k, qty, t, s, c, prem in zip(K, q, T, sigma, is_call, premium):
+        for i, S in enumerate(S_range):
+            intrinsic = max(S - k, 0) if c else max(k - S, 0)
+            expected[0, i] += qty * (intrinsic - prem)
+            expected[1:, i] += qty * np.array(reference(S, k, t, r, s, c)[1:])
+
+    np.testing.assert_allclose(portfolio_greeks(S_range, K, q, T, sigma, is_call, r, premium),
+                               expected, rtol=1e-9, atol=1e-10)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from src.simulation import bs_delta, hedge_pnl
+
+
+def loop_pnl(S_paths, K, T, r, sigma, dt, option_type, premium, qty):
+    # The original per-path, per-step delta hedge
+    N = S_paths.shape[1] - 1
+    pnl = []
+    for path in S_paths:
+        cash_account = 0.0
+        delta_prev = 0.0
+        for i in range(N):
+            S_t = path[i]
+            tau = T - i * dt
+            d1 = (np.log(S_t / K) + (r + 0.5 * sigma**2) * tau) / (sigma * np.sqrt(tau))
+            delta = norm.cdf(d1) if option_type == "call" else -norm.cdf(-d1)
+            cash_account -= (delta - delta_prev) * S_t
+            cash_account *= np.exp(r * dt)
+            delta_prev = delta
+        S_T = path[-1]
+        payoff = max(S_T - K, 0) if option_type == "call" else max(K - S_T, 0)
+        pnl.append((delta_prev * S_T + cash_account - payoff) * qty - premium * qty)
+    return np.array(pnl)
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_hedge_pnl_matches_loop(option_type):
+    S0, K, T, r, sigma, N, M, premium, qty = 100.0, 105.0, 1.0, 0.05, 0.25, 50, 40, 5.0, 3
+    dt = T / N
+    rng = np.random.default_rng(0)
+    W = np.concatenate([np.zeros((M, 1)), np.cumsum(rng.standard_normal((M, N)) * np.sqrt(dt), axis=1)], axis=1)
+    S_paths = S0 * np.exp((0.05 - 0.5 * sigma**2) * np.linspace(0, T, N + 1) + sigma * W)
+
+    delta_paths = bs_delta(S_paths[:, :N], K, T - np.arange(N) * dt, r, sigma, option_type)
+    pnl = hedge_pnl(S_paths, delta_paths, K, r, dt, option_type, premium, qty)
+
+    np.testing.assert_allclose(pnl, loop_pnl(S_paths, K, T, r, sigma, dt, option_type, premium, qty),
+                               rtol=1e-10, atol=1e-10)
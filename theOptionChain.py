@@ -1,27 +1,200 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import numpy as np
 import pandas as pd
+import yfinance as yf
 from datetime import datetime
 from src.utils import get_ticker_data, load_demo_option
-from src.pricing import black_scholes
-from src.greeks import GreekCalculator
+from src.pricing import black_scholes_vec, compute_all
+from src.greeks import NUMBA_AVAILABLE, bs_chain_kernel
 import plotly.graph_objects as go
 
 
-# highlight in-the-money cells
-def highlight_itm(row, current_price, option_type):
-    strike = row.name
-    if option_type == "call" and strike < current_price:
-        return ['background-color: #e6f7ff'] * len(row)
-    elif option_type == "put" and strike > current_price:
-        return ['background-color: #e6f7ff'] * len(row)
-    else:
-        return [''] * len(row)
+def itm_mask(strikes, current_price, option_type):
+    return strikes < current_price if option_type == "call" else strikes > current_price
+
+
+# highlight in-the-money rows, one vectorized strike comparison for the whole frame
+def itm_style(df, current_price, option_type):
+    css = np.where(itm_mask(df.index.to_numpy(), current_price, option_type), 'background-color: #e6f7ff', '')
+    return pd.DataFrame(np.broadcast_to(css[:, None], df.shape), index=df.index, columns=df.columns)
+
+
+# one yfinance Ticker per recently used symbol, shared server-wide so its HTTP session is reused across reruns
+@st.cache_resource(max_entries=64, show_spinner=False)
+def get_ticker(symbol):
+    return yf.Ticker(symbol)
 
 
 # cache yfinance data for 1h
-@st.cache_data(ttl=3600)
-def get_option(ticker_input):
-    return get_ticker_data(ticker_input)
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_history(symbol):
+    return get_ticker(symbol).history(period="5d")
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_expiries(symbol):
+    return get_ticker(symbol).options
+
+
+def get_option(symbol):
+    try:
+        history = get_history(symbol)
+        expiries = get_expiries(symbol)
+        if not history.empty and expiries:
+            return get_ticker(symbol), history, expiries
+    except Exception as e_yf:
+        print(f"[yfinance error] {e_yf}")
+    # yfinance had nothing usable, go through the API fallback
+    return get_ticker_data(symbol)
+
+
+# Styler formats and styles every cell in Python, so large tables use column_config
+# and mark in-the-money rows with an ITM column instead of shading
+STYLER_MAX_ROWS = 100
+TABLE_COLUMN_CONFIG = {
+    "Market Price": st.column_config.NumberColumn(format="$%.2f"),
+    "BS Price": st.column_config.NumberColumn(format="$%.2f"),
+    "Implied Vol": st.column_config.NumberColumn(format="percent"),
+    "ITM": st.column_config.CheckboxColumn("ITM")
+}
+
+
+def show_chain_table(df, current_price, option_type, styled):
+    if not styled:
+        df = df.assign(ITM=itm_mask(df.index.to_numpy(), current_price, option_type))
+        st.dataframe(df, use_container_width=True, column_config=TABLE_COLUMN_CONFIG)
+        return
+    styled = df.style.apply(itm_style, current_price=current_price, option_type=option_type, axis=None).format({
+        "Market Price": "${:.2f}",
+        "BS Price": "${:.2f}",
+        "Implied Vol": "{:.2%}"
+    })
+    st.dataframe(styled, use_container_width=True)
+
+
+CHAIN_COLUMNS = ["strike", "lastPrice", "impliedVolatility"]
+GREEK_LABELS = {
+    'Delta (Δ)': "delta",
+    'Gamma (Γ)': "gamma",
+    'Vega (ν)': "vega",
+    'Theta (θ)': "theta",
+    'Rho (ρ)': "rho"
+}
+
+
+# cache each expiry's chain by symbol; yfinance's Options namedtuple is built inside option_chain
+# and does not pickle, so return the frames. Runs in worker threads on the shared Ticker, whose
+# expirations build_full_chain loads first so each call is a single read-only GET
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_chain(symbol, expiry):
+    chain = get_ticker(symbol).option_chain(expiry)
+    return chain.calls[CHAIN_COLUMNS], chain.puts[CHAIN_COLUMNS]
+
+
+# Greeks of one option, cached on its exact inputs so reselecting it is free
+@st.cache_data(show_spinner=False)
+def compute_greeks(S, K, T, r, sigma, option_type):
+    return compute_all(S, K, T, r, sigma, option_type == "call")
+
+
+# priced chain for a (ticker, expiries, r) selection; widget reruns only filter and render it
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_full_chain(symbol, expiries, r, S, live_data, _ticker):
+    all_options = []
+    now = datetime.now()
+
+    if live_data:
+        # option_chain is one HTTP request per expiry, so overlap them instead of waiting on each in turn;
+        # the workers get this script run's context so cache_data works inside them.
+        # Loading the expirations here means no worker triggers the Ticker's lazy, non-thread-safe download
+        get_ticker(symbol).options
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(expiries))),
+                                initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())) as executor:
+            chains = list(executor.map(lambda expiry: _fetch_chain(symbol, expiry), expiries))
+    else:
+        chains = [(chain.calls[CHAIN_COLUMNS], chain.puts[CHAIN_COLUMNS])
+                  for chain in map(_ticker.option_chain, expiries)]
+
+    for expiry, (calls, puts) in zip(expiries, chains):
+        expiry_date = pd.to_datetime(expiry)
+        T = (expiry_date - now).days / 365
+
+        # only the columns the page uses were kept, instead of copying yfinance's full frame
+        df = pd.concat([calls.assign(OptionType="call"), puts.assign(OptionType="put")], ignore_index=True)
+        df["Expiry"] = expiry_date
+        df["T"] = T
+        K = df["strike"].to_numpy(dtype=float)
+        sigma = df["impliedVolatility"].to_numpy(dtype=float)
+        is_call = df["OptionType"].to_numpy() == "call"
+        # Greeks are left out of the cached frame; compute_greeks fills them in for the selected option only
+        if NUMBA_AVAILABLE:
+            # one compiled pass straight into a preallocated array, no NumPy temporaries
+            price = np.empty(len(df))
+            bs_chain_kernel(S, K, T, r, sigma, is_call, price)
+        else:
+            # constant for every strike on this expiry
+            sqrtT = math.sqrt(max(T, 0.0))
+            disc = math.exp(-r * T)
+            price = black_scholes_vec(S, K, T, r, sigma, is_call, sqrtT=sqrtT, disc=disc)
+        df["BS Price"] = price
+        all_options.append(df)
+
+    full_chain = pd.concat(all_options, ignore_index=True)
+    # two option types and a handful of expiries: small integer codes instead of per-row objects
+    full_chain["OptionType"] = full_chain["OptionType"].astype("category")
+    full_chain["Expiry"] = full_chain["Expiry"].astype("category")
+    # the build time identifies this snapshot of the chain for caches derived from it
+    return full_chain, now
+
+
+# the surface only changes with the chain snapshot or the strike range, so key the cache on those
+# instead of hashing the filtered frame; a hit skips both the grid and the figure build
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_surface_fig(symbol, expiries, snapshot, strike_range, _chain):
+    surface_df = _chain[["strike", "Expiry", "impliedVolatility"]].copy()
+    # only a handful of expiries, so compute days-to-expiry once per expiry and map
+    days_by_expiry = {expiry: (expiry - snapshot).days for expiry in map(pd.Timestamp, surface_df["Expiry"].unique())}
+    surface_df["days_to_expiry"] = surface_df["Expiry"].map(days_by_expiry)
+
+    # Dense (days, strike) grid built directly; NaN where a combination has no quote
+    iv = surface_df["impliedVolatility"].to_numpy()
+    valid = ~np.isnan(iv)
+    days_col = surface_df["days_to_expiry"].to_numpy()[valid]
+    strike_col = surface_df["strike"].to_numpy()[valid]
+    days = np.unique(days_col)
+    strikes = np.unique(strike_col)
+    cell = (np.searchsorted(days, days_col), np.searchsorted(strikes, strike_col))
+    # calls and puts share a cell, so average them as pivot_table did
+    iv_sum = np.zeros((days.size, strikes.size))
+    iv_count = np.zeros_like(iv_sum)
+    np.add.at(iv_sum, cell, iv[valid])
+    np.add.at(iv_count, cell, 1)
+    with np.errstate(invalid="ignore"):
+        Z = iv_sum / iv_count
+
+    fig = go.Figure(data=[go.Surface(
+        z=Z,
+        x=strikes,
+        y=days,
+        hovertemplate=
+        'Strike: %{x}<br>' +
+        'Days to Expiry: %{y}<br>' +
+        'Implied Vol: %{z:.2%}<extra></extra>'
+    )])
+
+    fig.update_layout(
+        title="",
+        scene=dict(
+            xaxis_title='Strike',
+            yaxis_title='Days to Expiry',
+            zaxis_title='Implied Volatility (%)'
+        ),
+        margin=dict(l=0, r=0, b=0, t=30)
+    )
+    return fig
 
 
 st.set_page_config(page_title="Black-Scholes Option Chain Pricing Model", layout="centered")
@@ -41,12 +214,13 @@ r = st.number_input("Risk-Free Rate (%)", min_value=0.0, max_value=100.00, value
 
 if ticker_input:
     try:
-        result = get_ticker_data(ticker_input)
+        result = get_option(ticker_input)
 
         if result is None:
             raise ValueError("Ticker data is None.")
 
         ticker, history, all_expiries = result
+        live_data = True
 
         if history.empty:
             st.error("Ticker not found or no recent price data.")
@@ -58,6 +232,7 @@ if ticker_input:
         st.warning(f"Error: {e}  \nLoading demo data instead.")
 
         ticker = load_demo_option()
+        live_data = False
         ticker_input = ticker.ticker
         all_expiries = ticker.option_chain.all_expiries()
         S = ticker.stock_price
@@ -67,46 +242,27 @@ if ticker_input:
     default_expiries = all_expiries[:2]
     selected_expiries = st.multiselect("Select Expiration Dates to Load", all_expiries, default=default_expiries)
 
-    all_options = []
-    now = datetime.now()
-
-    for expiry in selected_expiries:
-        expiry_date = pd.to_datetime(expiry)
-        T = (expiry_date - now).days / 365
-
-        chain = ticker.option_chain(expiry)
-
-        for opt_type, df in zip(["call", "put"], [chain.calls, chain.puts]):
-            df = df.copy()
-            df["OptionType"] = opt_type
-            df["Expiry"] = expiry_date
-            df["T"] = T
-            df["BS Price"] = df.apply(
-                lambda row: black_scholes(S, row["strike"], T, r, row["impliedVolatility"], opt_type),
-                axis=1
-                )
-            all_options.append(df)
-
-    full_chain = pd.concat(all_options, ignore_index=True)
+    full_chain, snapshot = build_full_chain(ticker_input, tuple(selected_expiries), r, S, live_data, ticker)
 
         # Strike price filter
     st.markdown("#### 🔎 Filter Strike Price Range")
-    min_strike = float(full_chain["strike"].min())
-    max_strike = float(full_chain["strike"].max())
+    # reduce the raw strike array directly, skipping the Series NaN handling
+    chain_strikes = full_chain["strike"].values
+    min_strike = float(chain_strikes.min())
+    max_strike = float(chain_strikes.max())
     strike_range = st.slider("Strike Range", min_strike, max_strike, (min_strike, max_strike))
 
     filtered = full_chain[
-            (full_chain["strike"] >= strike_range[0]) &
-            (full_chain["strike"] <= strike_range[1])
+            (chain_strikes >= strike_range[0]) &
+            (chain_strikes <= strike_range[1])
             ]
 
         # Option Chain Result Display
     st.subheader("📅 Option Chain Results")
 
-    for expiry in sorted(filtered["Expiry"].unique()):
+    # one split pass over the chain instead of a full-frame mask per expiry
+    for expiry, subset in filtered.groupby("Expiry", sort=True, observed=True):
         with st.expander(f"📆 Expiry: {expiry.date()}"):
-            subset = filtered[filtered["Expiry"] == expiry]
-
             calls_df = subset[subset["OptionType"] == "call"][
                     ["strike", "lastPrice", "BS Price", "impliedVolatility"]]
             puts_df = subset[subset["OptionType"] == "put"][
@@ -116,82 +272,49 @@ if ticker_input:
             calls_df.set_index("Strike", inplace=True)
             puts_df.set_index("Strike", inplace=True)
 
-            styled_calls = calls_df.style.apply(highlight_itm, current_price=S, option_type="call", axis=1).format({
-                    "Market Price": "${:.2f}",
-                    "BS Price": "${:.2f}",
-                    "Implied Vol": "{:.2%}"
-                })
-            styled_puts = puts_df.style.apply(highlight_itm, current_price=S, option_type="put", axis=1).format({
-                    "Market Price": "${:.2f}",
-                    "BS Price": "${:.2f}",
-                    "Implied Vol": "{:.2%}"
-                })
-
-            st.markdown(
-                    """
-                    <div style='
-                        display: inline-block;
-                        background-color: #e6f7ff;
-                        border-left: 4px solid #5faad1;
-                        padding: 0px 10px;
-                        font-size: 0.85rem;
-                        font-weight: 500;
-                        margin-bottom: 0.5rem;
-                        border-radius: 3px;
-                    '>
-                        *In The Money
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
+            # the shading legend only applies when both tables go through Styler
+            styled = max(len(calls_df), len(puts_df)) <= STYLER_MAX_ROWS
+            if styled:
+                st.markdown(
+                        """
+                        <div style='
+                            display: inline-block;
+                            background-color: #e6f7ff;
+                            border-left: 4px solid #5faad1;
+                            padding: 0px 10px;
+                            font-size: 0.85rem;
+                            font-weight: 500;
+                            margin-bottom: 0.5rem;
+                            border-radius: 3px;
+                        '>
+                            *In The Money
+                        </div>
+                        """,
+                        unsafe_allow_html=True
+                    )
             col1, col2 = st.columns(2)
 
             with col1:
                 st.markdown("#### 📈 Call Options")
-                st.dataframe(styled_calls, use_container_width=True)
+                show_chain_table(calls_df, S, "call", styled)
             with col2:
                 st.markdown("#### 📉 Put Options")
-                st.dataframe(styled_puts, use_container_width=True)
+                show_chain_table(puts_df, S, "put", styled)
 
     # --- Volatility Surface Plot --
     st.markdown("---")
     st.markdown("#### Volatility Surface Plot")
-    surface_df = filtered[["strike", "Expiry", "impliedVolatility"]].copy()
-    surface_df["days_to_expiry"] = (surface_df["Expiry"] - datetime.now()).dt.days
-
-    pivot = surface_df.pivot_table(index="days_to_expiry", columns="strike", values="impliedVolatility")
-
-    pivot = pivot.sort_index(axis=0).sort_index(axis=1)
     with st.expander("This 3D surface shows how implied volatility changes by strike and expiry.", expanded=True):
-        fig = go.Figure(data=[go.Surface(
-            z=pivot.values,
-            x=pivot.columns,
-            y=pivot.index,
-            hovertemplate=
-            'Strike: %{x}<br>' +
-            'Days to Expiry: %{y}<br>' +
-            'Implied Vol: %{z:.2%}<extra></extra>'
-        )])
-
-        fig.update_layout(
-            title="",
-            scene=dict(
-                xaxis_title='Strike',
-                yaxis_title='Days to Expiry',
-                zaxis_title='Implied Volatility (%)'
-            ),
-            margin=dict(l=0, r=0, b=0, t=30)
-        )
-
+        fig = build_surface_fig(ticker_input, tuple(selected_expiries), snapshot, strike_range, filtered)
         st.plotly_chart(fig, use_container_width=True)
 
     # --- Analyze a specific option ---
     st.markdown("---")
     st.markdown("#### Analyze a Specific Option")
     unique_options = filtered[["strike", "OptionType", "Expiry"]].drop_duplicates()
-    unique_options["label"] = unique_options.apply(
-        lambda row: f"{ticker_input} {row['OptionType'].capitalize()} @ {row['strike']} ({row['Expiry'].date()})",
-        axis=1)
+    unique_options["label"] = (ticker_input + " " + unique_options["OptionType"].str.capitalize()
+                               + " @ " + unique_options["strike"].astype(str)
+                               + " (" + unique_options["Expiry"].dt.strftime("%Y-%m-%d") + ")")
     labels = ["Select an option..."] + list(unique_options["label"])
     selected_row = st.selectbox("Select an Option", labels)
 
@@ -200,19 +323,16 @@ if ticker_input:
         strike = chosen["strike"]
         option_type = chosen["OptionType"]
         expiry_date = chosen["Expiry"]
-        T = (expiry_date - datetime.now()).days / 365
 
-        # Retrieve implied vol from original DataFrame
-        row_data = filtered[
-            (filtered["strike"] == strike) &
-            (filtered["OptionType"] == option_type) &
-            (filtered["Expiry"] == expiry_date)
-            ].iloc[0]
+        # drop_duplicates kept the first matching row's index label, so look it up directly;
+        # implied vol and price were computed with the chain
+        row_data = filtered.loc[chosen.name]
 
         sigma = row_data["impliedVolatility"]
-        bs_price = black_scholes(S, strike, T, r, sigma, option_type)
+        bs_price = row_data["BS Price"]
 
-        greeks = GreekCalculator(S, strike, T, r, sigma, option_type).to_dict()
+        option_greeks = compute_greeks(S, strike, row_data["T"], r, sigma, option_type)
+        greeks = {label: getattr(option_greeks, column) for label, column in GREEK_LABELS.items()}
         greeks_clean = {k: round(v, 4) for k, v in greeks.items()}
 
         with st.expander(f"{selected_row}", expanded=True):